@@ -0,0 +1,248 @@
+import json
+import logging
+import os
+import statistics
+from utils.keywordrepository import get_test_data, update_test_data
+from utils.model_utils import create_model, create_model_version, perform_inference
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+file_name = os.path.splitext(os.path.basename(__file__))[0] + "_data.json"
+RESULTS_DIR = "benchmark-results"
+
+
+def get_server_rss():
+    """
+    Read the resident set size of the API server process and all of its descendants.
+
+    The server PID is taken from the SERVER_PID environment variable and the RSS is read
+    from /proc, so this only works when the server runs on the same Linux host. Descendants
+    are included because `fastapi dev` runs the application in a worker spawned by a reloader.
+
+    Returns:
+        int: The combined RSS in bytes, or None if it cannot be determined.
+    """
+    server_pid = os.environ.get("SERVER_PID")
+    if not server_pid:
+        return None
+
+    # Map each process to its children using the parent PID field of /proc/<pid>/stat
+    children = {}
+    for pid in filter(str.isdigit, os.listdir("/proc")):
+        try:
+            with open(f"/proc/{pid}/stat", "r") as file:
+                # The command name may contain spaces, so parse the fields after its closing parenthesis
+                parent_pid = file.read().rsplit(")", 1)[1].split()[1]
+        except (FileNotFoundError, PermissionError, IndexError):
+            continue
+        children.setdefault(parent_pid, []).append(pid)
+
+    total = 0
+    found = False
+    pending = [server_pid]
+    while pending:
+        pid = pending.pop()
+        pending.extend(children.get(pid, []))
+        try:
+            with open(f"/proc/{pid}/status", "r") as file:
+                for line in file:
+                    if line.startswith("VmRSS:"):
+                        total += int(line.split()[1]) * 1024
+                        found = True
+                        break
+        except (FileNotFoundError, PermissionError, ValueError):
+            continue
+    if not found:
+        logger.warning(f"Unable to read RSS for server PID {server_pid}.")
+        return None
+    return total
+
+
+def timed_inference(test_case_name, version, timeout):
+    """
+    Perform inference on a model version.
+
+    Args:
+        test_case_name (str): The name of the test case holding the inference data.
+        version (dict): The model version to run inference against.
+        timeout (int): The maximum time to wait for the inference request, in seconds.
+
+    Returns:
+        Response: The response object from the POST request. Its elapsed attribute holds the request latency.
+    """
+    update_test_data(test_case_name, "model_id", version["model_id"], file_name)
+    update_test_data(test_case_name, "version_id", version["version_id"], file_name)
+    return perform_inference(test_case_name, file_name, timeout=timeout)
+
+
+def median_or_none(values):
+    values = list(values)
+    return statistics.median(values) if values else None
+
+
+def format_seconds(value):
+    return f"{value:.3f}" if value is not None else "n/a"
+
+
+def test_model_version_residency_scaling():
+    """
+    Benchmark inference latency and server memory as the number of resident model versions grows.
+    Steps:
+    1. Create the models the versions are spread across.
+    2. For each step in version_steps, create versions up to that count, cycling through the
+       Hugging Face model names.
+    3. Run one cold inference on each new version, then round-robin steady-state inference
+       across every resident version.
+    4. Record cold latency (split into first loads of a Hugging Face model and versions sharing an
+       already loaded one), steady-state latency, suspected reloads and server RSS per step.
+    5. Write the results to benchmark-results/ and log a summary table.
+    """
+    test_case_name = "test_model_version_residency_scaling"
+
+    # The helpers read their input from the data file, so it is rewritten during the run; restore it afterwards
+    data_path = os.path.join(os.getcwd(), "utils", file_name)
+    with open(data_path, "r") as file:
+        original_data = file.read()
+    try:
+        run_residency_benchmark(test_case_name)
+    finally:
+        with open(data_path, "w") as file:
+            file.write(original_data)
+
+
+def run_residency_benchmark(test_case_name):
+    """
+    Run the residency benchmark described in test_model_version_residency_scaling.
+
+    Args:
+        test_case_name (str): The name of the test case holding the benchmark parameters.
+    """
+    # Step 1: Fetch the benchmark parameters from the JSON file
+    logger.info(f"Fetching test data for '{test_case_name}' from file '{file_name}'.")
+    test_data = get_test_data(test_case_name, file_name)
+    expected_status_code = test_data["expected_status_code"]
+    hugging_face_models = test_data["hugging_face_models"]
+    timeout = test_data["inference_timeout"]
+    reload_factor = test_data["reload_factor"]
+    reload_floor_seconds = test_data["reload_floor_seconds"]
+    model_name = test_data["model_name"]
+    version_name = test_data["version_name"]
+
+    # Step 2: Create the models
+    model_ids = []
+    for index in range(test_data["model_count"]):
+        update_test_data(test_case_name, "name", f"{model_name} {index + 1}", file_name)
+        response_model = create_model(test_case_name, file_name)
+        assert response_model.status_code == expected_status_code, (
+            f"Failed to create model. Expected status code {expected_status_code}, got {response_model.status_code}."
+        )
+        model_ids.append(response_model.json()["id"])
+    logger.info(f"Created {len(model_ids)} models for the residency benchmark.")
+
+    versions = []
+    results = []
+    loaded_hugging_face_models = set()
+    previous_rss = get_server_rss()
+    if previous_rss is None:
+        logger.warning("SERVER_PID is not set or unreadable; server RSS will not be recorded.")
+
+    for step in test_data["version_steps"]:
+        # Step 3: Grow the number of resident versions up to this step
+        new_versions = []
+        while len(versions) < step:
+            index = len(versions)
+            model_id = model_ids[index % len(model_ids)]
+            hugging_face_model = hugging_face_models[index % len(hugging_face_models)]
+            update_test_data(test_case_name, "id", model_id, file_name)
+            update_test_data(test_case_name, "name", f"{version_name} {index + 1}", file_name)
+            update_test_data(test_case_name, "hugging_face_model", hugging_face_model, file_name)
+            response_version = create_model_version(test_case_name, file_name)
+            assert response_version.status_code == expected_status_code, (
+                f"Failed to create model version. Expected status code {expected_status_code}, "
+                f"got {response_version.status_code}."
+            )
+            version = {
+                "model_id": model_id,
+                "version_id": response_version.json()["id"],
+                "hugging_face_model": hugging_face_model,
+                "first_load": hugging_face_model not in loaded_hugging_face_models,
+                "cold_latency": None,
+                "steady_latencies": [],
+            }
+            versions.append(version)
+            new_versions.append(version)
+            loaded_hugging_face_models.add(hugging_face_model)
+
+        # Step 4: First call on each new version is the cold load
+        for version in new_versions:
+            response = timed_inference(test_case_name, version, timeout)
+            assert response.status_code == expected_status_code, (
+                f"Cold inference failed for version {version['version_id']}. "
+                f"Expected status code {expected_status_code}, got {response.status_code}."
+            )
+            version["cold_latency"] = response.elapsed.total_seconds()
+
+        # Step 5: Round-robin steady-state inference across every resident version
+        step_latencies = []
+        suspected_reloads = 0
+        for _ in range(test_data["steady_state_rounds"]):
+            for version in versions:
+                response = timed_inference(test_case_name, version, timeout)
+                assert response.status_code == expected_status_code, (
+                    f"Inference failed for version {version['version_id']}. "
+                    f"Expected status code {expected_status_code}, got {response.status_code}."
+                )
+                latency = response.elapsed.total_seconds()
+                # Compare against the version's own warm calls, as the first call is not cold when the
+                # server loads the model on version creation or already holds the Hugging Face model
+                if version["steady_latencies"]:
+                    warm_baseline = statistics.median(version["steady_latencies"])
+                    if latency >= reload_factor * warm_baseline and latency - warm_baseline >= reload_floor_seconds:
+                        suspected_reloads += 1
+                version["steady_latencies"].append(latency)
+                step_latencies.append(latency)
+
+        rss = get_server_rss()
+        rss_per_new_version = None
+        if rss is not None and previous_rss is not None and new_versions:
+            rss_per_new_version = (rss - previous_rss) / len(new_versions)
+        previous_rss = rss
+
+        step_result = {
+            "resident_versions": len(versions),
+            "new_versions": len(new_versions),
+            "first_load_cold_latency_median": median_or_none(v["cold_latency"] for v in new_versions if v["first_load"]),
+            "shared_cold_latency_median": median_or_none(v["cold_latency"] for v in new_versions if not v["first_load"]),
+            "steady_latency_median": median_or_none(step_latencies),
+            "steady_latency_max": max(step_latencies) if step_latencies else None,
+            "suspected_reloads": suspected_reloads,
+            "server_rss_bytes": rss,
+            "rss_per_new_version_bytes": rss_per_new_version,
+        }
+        results.append(step_result)
+        logger.info(f"Residency step completed: {step_result}")
+
+    # Step 6: Persist and summarise the results
+    eviction_step = next((r["resident_versions"] for r in results if r["suspected_reloads"]), None)
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    results_path = os.path.join(RESULTS_DIR, "model_version_residency.json")
+    with open(results_path, "w") as file:
+        json.dump({"steps": results, "versions": versions, "eviction_step": eviction_step}, file, indent=4)
+
+    logger.info(
+        "resident | first-load cold (s) | shared cold (s) | steady median (s) | steady max (s) | reloads | RSS (MiB)"
+    )
+    for r in results:
+        rss_mib = f"{r['server_rss_bytes'] / 2 ** 20:.1f}" if r["server_rss_bytes"] is not None else "n/a"
+        logger.info(
+            f"{r['resident_versions']:>8} | {format_seconds(r['first_load_cold_latency_median']):>19} | "
+            f"{format_seconds(r['shared_cold_latency_median']):>15} | {format_seconds(r['steady_latency_median']):>17} | "
+            f"{format_seconds(r['steady_latency_max']):>14} | {r['suspected_reloads']:>7} | {rss_mib:>9}"
+        )
+    if eviction_step is None:
+        logger.info("No suspected model reloads observed; all versions stayed resident.")
+    else:
+        logger.info(f"Suspected eviction first observed at {eviction_step} resident versions.")
+    logger.info(f"Residency benchmark results written to {results_path}.")
@@ -0,0 +1 @@
+pytest_plugins = ["pytester", "utils.result_sink", "utils.resource_ledger", "utils.profiling"]
@@ -3,7 +3,6 @@ import logging
 import requests
 import os
 from utils.keywordrepository import get_test_data, update_test_data
-from utils.basetest import delete_all_existing_models
 from utils.model_utils import create_model, create_model_version, perform_inference
 
 # Configure logging
@@ -14,15 +13,6 @@ BASE_URL = "http://localhost:8000"
 file_name = os.path.splitext(os.path.basename(__file__))[0] + "_data.json"
 
 
-def test_cleanup_before_class():
-    """"
-    Clears existing data by deleting all previously created models.
-    """
-    logger.info("Starting data cleanup: Deleting all existing models before test execution.")
-    delete_all_existing_models(file_name)
-    logger.info("Data cleanup completed successfully.")
-
-
 def test_inference_with_valid_data():
     """
     Test to perform inference using valid data.
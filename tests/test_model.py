@@ -4,8 +4,8 @@ import uuid
 import logging
 import os
 from utils.keywordrepository import get_test_data, update_test_data
-from utils.basetest import delete_all_existing_models
 from utils.model_utils import create_model, delete_model
+from utils.resource_ledger import run_scoped_name
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -15,15 +15,6 @@ BASE_URL = "http://localhost:8000"
 file_name = os.path.splitext(os.path.basename(__file__))[0] + "_data.json"
 
 
-def test_cleanup_before_class():
-    """"
-    Clears existing data by deleting all previously created models.
-    """
-    logger.info("Starting data cleanup: Deleting all existing models before test execution.")
-    delete_all_existing_models(file_name)
-    logger.info("Data cleanup completed successfully.")
-
-
 def test_add_model_with_valid_data():
     """
     Test to add a model with valid data.
@@ -57,8 +48,8 @@ def test_add_model_with_valid_data():
     assert response_model.status_code == expected_status_code, (
         f"Expected status code {expected_status_code}, but got {response_model.status_code}."
     )
-    assert response_model_data["name"] == test_data["name"], (
-        f"Expected name '{test_data['name']}', but got '{response_model_data['name']}'."
+    assert response_model_data["name"] == run_scoped_name(test_data["name"]), (
+        f"Expected name '{run_scoped_name(test_data['name'])}', but got '{response_model_data['name']}'."
     )
     assert response_model_data.get("owner") == test_data["owner"], (
         f"Expected owner '{test_data['owner']}', but got '{response_model_data['owner']}'."
@@ -104,8 +95,8 @@ def test_add_model_with_no_data():
     assert response_model.status_code == expected_status_code, (
         f"Expected status code {expected_status_code}, but got {response_model.status_code}."
     )
-    assert response_model_data.get("name") == test_data["name"], (
-        f"Expected name '{test_data['name']}', but got '{response_model_data.get('name')}'."
+    assert response_model_data.get("name") == run_scoped_name(test_data["name"]), (
+        f"Expected name '{run_scoped_name(test_data['name'])}', but got '{response_model_data.get('name')}'."
     )
     assert response_model_data.get("owner") == test_data["owner"], (
         f"Expected owner '{test_data['owner']}', but got '{response_model_data.get('owner')}'."
@@ -3,7 +3,6 @@ import requests
 import logging
 import os
 from utils.keywordrepository import get_test_data, update_test_data
-from utils.basetest import delete_all_existing_models
 from utils.model_utils import create_model, create_model_version, delete_model_version
 
 # Configure logging
@@ -14,14 +13,6 @@ BASE_URL = "http://localhost:8000"
 file_name = os.path.splitext(os.path.basename(__file__))[0] + "_data.json"
 
 
-
-def test_cleanup_before_class():
-    """
-    Pytest fixture to run the cleanup before each test class.
-    """
-    delete_all_existing_models(file_name)
-
-
 def test_add_model_version_with_valid_data():
     """
     Test to create a model version with valid data.
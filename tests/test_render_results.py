@@ -0,0 +1,68 @@
+import json
+import logging
+from utils.render_results import ALLURE_STATUSES, group_by_run, load_results, render_allure, render_html
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+
+def make_record(run_id, nodeid, start, outcome="passed"):
+    return {
+        "run_id": run_id, "nodeid": nodeid, "outcome": outcome, "start": start, "stop": start + 1,
+        "duration": 1.0, "message": None, "log_excerpt": [], "requests": [],
+    }
+
+
+def write_jsonl(path, records):
+    with open(path, "w") as file:
+        for record in records:
+            file.write(json.dumps(record) + "\n")
+    return str(path)
+
+
+def test_load_results_merges_runs_in_start_order(tmp_path):
+    """
+    Test that records from several files are ordered by start time and grouped by run in start order.
+    """
+    # The later run is written first and its records are out of order
+    later = write_jsonl(tmp_path / "later.jsonl", [
+        make_record("run-b", "tests/test_a.py::test_two", 210),
+        make_record("run-b", "tests/test_a.py::test_one", 200),
+    ])
+    earlier = write_jsonl(tmp_path / "earlier.jsonl", [
+        make_record("run-a", "tests/test_a.py::test_one", 100),
+        make_record("run-a", "tests/test_a.py::test_two", 110),
+    ])
+
+    records = load_results([later, earlier])
+    assert [record["start"] for record in records] == [100, 110, 200, 210]
+
+    runs = group_by_run(records)
+    assert list(runs) == ["run-a", "run-b"]
+    assert [record["nodeid"] for record in runs["run-b"]] == ["tests/test_a.py::test_one", "tests/test_a.py::test_two"]
+
+
+def test_render_html_adds_trend_table_only_for_several_runs(tmp_path):
+    """
+    Test that the HTML report contains a trend table only when more than one run is rendered.
+    """
+    single_run = [make_record("run-a", "tests/test_a.py::test_one", 100)]
+    several_runs = single_run + [make_record("run-b", "tests/test_a.py::test_one", 200, outcome="failed")]
+
+    render_html(single_run, tmp_path / "single.html")
+    render_html(several_runs, tmp_path / "several.html")
+
+    assert "<h2>Trend</h2>" not in (tmp_path / "single.html").read_text()
+    assert "<h2>Trend</h2>" in (tmp_path / "several.html").read_text()
+
+
+def test_render_allure_maps_errors_to_broken(tmp_path):
+    """
+    Test that tests erroring outside their body are reported to Allure as broken.
+    """
+    assert ALLURE_STATUSES["error"] == "broken"
+
+    render_allure([make_record("run-a", "tests/test_a.py::test_one", 100, outcome="error")], tmp_path)
+    results = [json.loads(path.read_text()) for path in tmp_path.glob("*-result.json")]
+    assert [result["status"] for result in results] == ["broken"]
@@ -0,0 +1,118 @@
+import json
+import logging
+import os
+import subprocess
+import sys
+import threading
+import uuid
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import pytest
+from utils import resource_ledger
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.fixture
+def stub_server():
+    """
+    Start a minimal stand-in for the API that creates models and records every DELETE it receives.
+    The delete_status attribute sets the status code returned for DELETE requests.
+    """
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, *args):
+            pass
+
+        def send_json(self, status_code, body):
+            data = json.dumps(body).encode()
+            self.send_response(status_code)
+            self.send_header("Content-Type", "application/json")
+            self.send_header("Content-Length", str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_POST(self):
+            body = json.loads(self.rfile.read(int(self.headers["Content-Length"])))
+            self.send_json(200, {"id": str(uuid.uuid4()), "name": body["name"], "owner": body["owner"]})
+
+        def do_DELETE(self):
+            server.deleted.append(self.path)
+            self.send_json(server.delete_status, {"detail": "deleted"})
+
+    server = ThreadingHTTPServer(("127.0.0.1", 0), Handler)
+    server.deleted = []
+    server.delete_status = 200
+    server.url = f"http://127.0.0.1:{server.server_address[1]}"
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield server
+    server.shutdown()
+    server.server_close()
+
+
+@pytest.fixture
+def ledger(stub_server, monkeypatch):
+    """
+    Point the ledger at the stub server with empty state, so it does not touch this run's own ledger.
+    """
+    monkeypatch.setattr(resource_ledger, "BASE_URL", stub_server.url)
+    monkeypatch.setattr(resource_ledger, "_models", {})
+    monkeypatch.setattr(resource_ledger, "_versions", {})
+    monkeypatch.setattr(resource_ledger, "_leaked", [])
+    return resource_ledger
+
+
+def test_release_all_deletes_at_interpreter_exit(stub_server):
+    """
+    Test that a model created through model_utils is deleted by the atexit handler when the process exits.
+    """
+    script = (
+        "from utils import model_utils, resource_ledger\n"
+        f"model_utils.BASE_URL = resource_ledger.BASE_URL = {stub_server.url!r}\n"
+        "response = model_utils.create_model('test_add_model_with_valid_data', 'test_model_data.json')\n"
+        "print(response.json()['id'])\n"
+    )
+    env = dict(os.environ, PYTHONPATH=PROJECT_ROOT)
+    result = subprocess.run([sys.executable, "-c", script], cwd=PROJECT_ROOT, env=env,
+                            capture_output=True, text=True, timeout=60)
+    assert result.returncode == 0, f"Subprocess failed: {result.stderr}"
+    model_id = result.stdout.strip().splitlines()[-1]
+
+    logger.info(f"DELETE requests received by the stub: {stub_server.deleted}")
+    assert stub_server.deleted == [f"/models/{model_id}"], (
+        f"Expected the exit handler to delete model {model_id}, got {stub_server.deleted}."
+    )
+
+
+def test_release_all_deletes_versions_before_models(ledger, stub_server):
+    """
+    Test that versions are deleted before models and the ledger is empty afterwards.
+    """
+    ledger.record_model("model-1")
+    ledger.record_model_version("model-1", "version-1")
+
+    leaked = ledger.release_all()
+
+    assert leaked == []
+    assert stub_server.deleted == ["/models/model-1/versions/version-1", "/models/model-1"]
+    assert ledger._models == {} and ledger._versions == {}
+
+
+def test_release_all_keeps_failed_deletions_for_retry(ledger, stub_server):
+    """
+    Test that resources whose deletion fails are reported as leaked and retried by the next call.
+    """
+    ledger.record_model("model-1")
+    stub_server.delete_status = 500
+
+    leaked = ledger.release_all()
+    assert leaked == [{"url": f"{stub_server.url}/models/model-1", "error": "status code 500"}]
+    assert "model-1" in ledger._models, "A failed deletion must stay in the ledger."
+
+    stub_server.delete_status = 200
+    assert ledger.release_all() == []
+    assert ledger._models == {}
+    assert stub_server.deleted == ["/models/model-1", "/models/model-1"]
@@ -0,0 +1,76 @@
+import json
+import logging
+import os
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+SAMPLE_TESTS = """
+import datetime
+import types
+import pytest
+from utils.result_sink import record_request_timing
+
+
+def fake_response():
+    request = types.SimpleNamespace(method="GET", url="http://127.0.0.1:8000/models")
+    return types.SimpleNamespace(request=request, status_code=200, elapsed=datetime.timedelta(seconds=0.25))
+
+
+@pytest.fixture
+def broken_fixture():
+    raise RuntimeError("setup exploded")
+
+
+def test_passes():
+    record_request_timing(fake_response())
+
+
+def test_fails_in_setup(broken_fixture):
+    pass
+
+
+@pytest.mark.skip(reason="not today")
+def test_skipped():
+    pass
+"""
+
+
+def test_result_sink_writes_one_record_per_test(pytester, monkeypatch):
+    """
+    Test that the sink writes the outcome, message and request timings of each test.
+    The inner run uses a subprocess so its sink does not share module state with this run's sink.
+    """
+    monkeypatch.setenv("PYTHONPATH", PROJECT_ROOT)
+    pytester.makepyfile(test_sample=SAMPLE_TESTS)
+    results_path = pytester.path / "results.jsonl"
+
+    result = pytester.runpytest_subprocess("-p", "utils.result_sink", f"--results-jsonl={results_path}")
+    result.assert_outcomes(passed=1, errors=1, skipped=1)
+
+    records = {}
+    for line in results_path.read_text().splitlines():
+        record = json.loads(line)
+        records[record["nodeid"].split("::")[-1]] = record
+    logger.info(f"Records written by the sink: {records}")
+    assert len({record["run_id"] for record in records.values()}) == 1
+
+    passed = records["test_passes"]
+    assert passed["outcome"] == "passed"
+    assert passed["message"] is None
+    assert passed["requests"] == [
+        {"method": "GET", "url": "http://127.0.0.1:8000/models", "status_code": 200, "elapsed": 0.25}
+    ]
+
+    errored = records["test_fails_in_setup"]
+    assert errored["outcome"] == "error"
+    assert "setup exploded" in errored["message"]
+    assert errored["requests"] == []
+
+    skipped = records["test_skipped"]
+    assert skipped["outcome"] == "skipped"
+    assert skipped["message"] == "Skipped: not today"
+    assert skipped["requests"] == []
@@ -1,6 +1,7 @@
 import requests
 import logging
 from utils.keywordrepository import get_test_data
+from utils.result_sink import record_request_timing
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -19,6 +20,7 @@ def delete_all_existing_models(file_name):
     # Step 1: Get all existing models
     logger.info("Fetching all existing models for cleanup...")
     get_response = requests.get(f"{BASE_URL}/models")
+    record_request_timing(get_response)
     assert get_response.status_code == expected_status_code, (
         f"Failed to fetch models. Expected status code {expected_status_code}, got {get_response.status_code}"
     )
@@ -31,6 +33,7 @@ def delete_all_existing_models(file_name):
         if model_id:
             logger.info(f"Deleting model with ID: {model_id}")
             delete_response = requests.delete(f"{BASE_URL}/models/{model_id}")
+            record_request_timing(delete_response)
             assert delete_response.status_code == expected_status_code, (
                 f"Failed to delete model with ID {model_id}. Expected status code {expected_status_code}, "
                 f"got {delete_response.status_code}"
@@ -40,6 +43,7 @@ def delete_all_existing_models(file_name):
     # Step 3: Verify that no models are left
     logger.info("Verifying that no models are left after cleanup...")
     get_response_after_deletion = requests.get(f"{BASE_URL}/models")
+    record_request_timing(get_response_after_deletion)
     assert get_response_after_deletion.status_code == expected_status_code, (
         f"Failed to fetch models after deletion. Expected status code {expected_status_code}, "
         f"got {get_response_after_deletion.status_code}"
@@ -2,6 +2,10 @@ import requests
 import logging
 import time
 from utils.keywordrepository import get_test_data
+from utils.result_sink import record_request_timing
+from utils.resource_ledger import (
+    record_model, record_model_version, forget_model, forget_model_version, run_scoped_name
+)
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
@@ -26,10 +30,15 @@ def create_model(test_case_name, json_file_name):
     """
     # Fetch test data for the specified test case
     model_data = get_test_data(test_case_name, json_file_name)
+    if "name" in model_data:
+        model_data["name"] = run_scoped_name(model_data["name"])
 
     # Send POST request to create the model
     logger.info(f"Creating a model with the name: {model_data['name']} and owner: {model_data['owner']}")
     response = requests.post(f"{BASE_URL}/models", json=model_data)
+    record_request_timing(response)
+    if response.ok:
+        record_model(response.json()["id"])
 
     # Log the model creation response
     logger.info(f"response is: {response.json()}")
@@ -57,6 +66,9 @@ def create_model_version(test_case_name, json_file_name):
     logger.info(
         f"Creating a model version for model ID: {model_id} with the name: {version_data['name']} and Hugging Face model: {version_data['hugging_face_model']}")
     response = requests.post(f"{BASE_URL}/models/{model_id}/versions", json=version_data)
+    record_request_timing(response)
+    if response.ok:
+        record_model_version(model_id, response.json()["id"])
 
     # Log the model version creation response
     logger.info(f"Model version created successfully with response: {response.json()}")
@@ -92,6 +104,7 @@ def perform_inference(test_case_name, json_file_name, timeout=60):
         json={"text": text},
         timeout=timeout
     )
+    record_request_timing(response)
 
     # Log the response and return it
     logger.info(f"Inference response received with status code: {response.status_code}")
@@ -123,6 +136,9 @@ def delete_model(test_case_name, json_file_name):
     # Send DELETE request to delete the model
     logger.info(f"Deleting model with ID: {model_id}")
     response = requests.delete(f"{BASE_URL}/models/{model_id}")
+    record_request_timing(response)
+    if response.ok:
+        forget_model(model_id)
 
     # Log the model deletion response
     logger.info(f"Model deleted with response: {response.json()}")
@@ -154,6 +170,9 @@ def delete_model_version(test_case_name, json_file_name):
     # Send DELETE request to delete the model version
     logger.info(f"Deleting version with ID: {version_id} for model with ID: {model_id}")
     response = requests.delete(f"{BASE_URL}/models/{model_id}/versions/{version_id}")
+    record_request_timing(response)
+    if response.ok:
+        forget_model_version(model_id, version_id)
 
     # Log the deletion response
     logger.info(f"Model version deleted successfully with response: {response.json()}")
@@ -0,0 +1,167 @@
+import cProfile
+import functools
+import os
+import pstats
+import re
+import time
+import tracemalloc
+import pytest
+
+DEFAULT_PROFILE_DIR = "profile-results"
+HELPER_NAMES = ["create_model", "create_model_version", "perform_inference", "delete_model", "delete_model_version"]
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("profiling")
+    group.addoption(
+        "--profile",
+        action="store_true",
+        help="Profile each test with cProfile and tracemalloc and summarise the hotspots.",
+    )
+    group.addoption(
+        "--profile-helpers",
+        action="store_true",
+        help="With --profile, also time and track allocations of each model_utils helper call.",
+    )
+    group.addoption(
+        "--profile-dir",
+        default=DEFAULT_PROFILE_DIR,
+        help=f"Directory for the per-test and merged session .pstats files (default: {DEFAULT_PROFILE_DIR}).",
+    )
+    group.addoption(
+        "--profile-top",
+        type=int,
+        default=15,
+        help="Number of rows in the hotspot and peak-allocation tables (default: 15).",
+    )
+
+
+def pytest_configure(config):
+    # Nothing is registered or patched unless profiling was asked for
+    if not config.getoption("--profile"):
+        return
+    profiler = TestProfiler(config.getoption("--profile-dir"), config.getoption("--profile-top"))
+    config.pluginmanager.register(profiler, "profiling")
+    if config.getoption("--profile-helpers"):
+        profiler.wrap_helpers()
+
+
+def _format_bytes(size):
+    return f"{size / 1024:.1f} KiB" if size < 2 ** 20 else f"{size / 2 ** 20:.1f} MiB"
+
+
+class TestProfiler:
+    """
+    Runs every test under cProfile and tracemalloc.
+
+    Each test's profile is written to <profile dir>/<test>.pstats, and at session end the profiles
+    are merged into session.pstats and the top hotspots and peak allocations are written to
+    summary.txt and the terminal summary.
+    """
+
+    __test__ = False
+
+    def __init__(self, profile_dir, top):
+        self.profile_dir = profile_dir
+        self.top = top
+        self.pstats_files = []
+        self.peaks = {}
+        self.helper_stats = {}
+        # Traced memory when the running test started; peaks are reported relative to it
+        self.test_baseline = 0
+        # Highest peak seen by helper calls in the running test, since they reset the tracemalloc peak
+        self.helper_peak = 0
+        self.summary_lines = []
+
+    def wrap_helpers(self):
+        """
+        Replace the model_utils helpers with wrappers recording per-call time and peak allocation.
+
+        This must run before the test modules are imported, so they pick up the wrapped helpers.
+        """
+        from utils import model_utils
+
+        for name in HELPER_NAMES:
+            setattr(model_utils, name, self._wrap_helper(name, getattr(model_utils, name)))
+
+    def _wrap_helper(self, name, func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            self.helper_peak = max(self.helper_peak, tracemalloc.get_traced_memory()[1] - self.test_baseline)
+            tracemalloc.reset_peak()
+            baseline = tracemalloc.get_traced_memory()[0]
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                elapsed = time.perf_counter() - start
+                peak = tracemalloc.get_traced_memory()[1]
+                self.helper_peak = max(self.helper_peak, peak - self.test_baseline)
+                stats = self.helper_stats.setdefault(name, {"calls": 0, "total": 0.0, "max": 0.0, "peak": 0})
+                stats["calls"] += 1
+                stats["total"] += elapsed
+                stats["max"] = max(stats["max"], elapsed)
+                stats["peak"] = max(stats["peak"], peak - baseline)
+
+        return wrapper
+
+    def pytest_sessionstart(self, session):
+        os.makedirs(self.profile_dir, exist_ok=True)
+        tracemalloc.start()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_call(self, item):
+        profile = cProfile.Profile()
+        self.helper_peak = 0
+        tracemalloc.reset_peak()
+        self.test_baseline = tracemalloc.get_traced_memory()[0]
+        profile.enable()
+        try:
+            yield
+        finally:
+            profile.disable()
+            peak = tracemalloc.get_traced_memory()[1] - self.test_baseline
+            self.peaks[item.nodeid] = max(peak, self.helper_peak)
+            self.test_baseline = 0
+            pstats_file = os.path.join(self.profile_dir, re.sub(r"[^\w.-]+", "_", item.nodeid) + ".pstats")
+            profile.dump_stats(pstats_file)
+            self.pstats_files.append(pstats_file)
+
+    def pytest_sessionfinish(self, session):
+        tracemalloc.stop()
+        if not self.pstats_files:
+            return
+
+        session_stats = pstats.Stats(*self.pstats_files)
+        session_file = os.path.join(self.profile_dir, "session.pstats")
+        session_stats.dump_stats(session_file)
+
+        lines = [f"Merged session profile: {session_file}", "", f"Top {self.top} hotspots by own time:"]
+        lines.append(f"{'calls':>10} {'tottime (s)':>12} {'cumtime (s)':>12}  function")
+        hotspots = sorted(session_stats.stats.items(), key=lambda item: item[1][2], reverse=True)
+        for (file_name, line, function), (_, calls, tottime, cumtime, _) in hotspots[:self.top]:
+            lines.append(f"{calls:>10} {tottime:>12.4f} {cumtime:>12.4f}  {file_name}:{line}({function})")
+
+        lines += ["", f"Top {self.top} tests by peak allocation above their starting memory:"]
+        for nodeid, peak in sorted(self.peaks.items(), key=lambda item: item[1], reverse=True)[:self.top]:
+            lines.append(f"{_format_bytes(peak):>12}  {nodeid}")
+
+        if self.helper_stats:
+            lines += ["", "model_utils helper calls:"]
+            lines.append(f"{'calls':>10} {'total (s)':>12} {'max (s)':>12} {'peak':>12}  helper")
+            for name, stats in sorted(self.helper_stats.items(), key=lambda item: item[1]["total"], reverse=True):
+                lines.append(
+                    f"{stats['calls']:>10} {stats['total']:>12.4f} {stats['max']:>12.4f} "
+                    f"{_format_bytes(stats['peak']):>12}  {name}"
+                )
+
+        with open(os.path.join(self.profile_dir, "summary.txt"), "w") as file:
+            file.write("\n".join(lines) + "\n")
+        self.summary_lines = lines
+
+    def pytest_terminal_summary(self, terminalreporter):
+        if not self.summary_lines:
+            return
+        terminalreporter.section("profile")
+        for line in self.summary_lines:
+            terminalreporter.line(line)
@@ -0,0 +1,158 @@
+import argparse
+import hashlib
+import html
+import json
+import os
+import uuid
+from utils.result_sink import DEFAULT_RESULTS_PATH
+
+ALLURE_STATUSES = {"passed": "passed", "failed": "failed", "error": "broken", "skipped": "skipped"}
+
+
+def load_results(file_paths):
+    """
+    Load and merge test records from one or more JSONL result files.
+
+    Args:
+        file_paths (list): Paths of the JSONL files written by the result sink.
+
+    Returns:
+        list: The test records ordered by start time.
+    """
+    records = []
+    for file_path in file_paths:
+        try:
+            with open(file_path, "r") as file:
+                for line in file:
+                    if line.strip():
+                        records.append(json.loads(line))
+        except FileNotFoundError:
+            raise FileNotFoundError(f"The results file '{file_path}' was not found.")
+    records.sort(key=lambda record: record["start"])
+    return records
+
+
+def group_by_run(records):
+    """
+    Group test records by run ID, preserving the order in which the runs started.
+
+    Args:
+        records (list): The test records ordered by start time.
+
+    Returns:
+        dict: Run ID mapped to the list of records of that run.
+    """
+    runs = {}
+    for record in records:
+        runs.setdefault(record["run_id"], []).append(record)
+    return runs
+
+
+def render_html(records, output_path):
+    """
+    Render a standalone HTML report for the latest run, with a trend table across all runs.
+
+    Args:
+        records (list): The test records ordered by start time.
+        output_path (str): Path of the HTML file to write.
+    """
+    runs = group_by_run(records)
+    run_ids = list(runs)
+    latest = runs[run_ids[-1]] if run_ids else []
+
+    rows = []
+    for record in latest:
+        request_rows = "".join(
+            f"<li>{html.escape(r['method'])} {html.escape(r['url'])} {r['status_code']} {r['elapsed']:.3f}s</li>"
+            for r in record.get("requests", [])
+        )
+        details = html.escape("\n".join(record.get("log_excerpt", [])) + "\n" + (record.get("message") or ""))
+        rows.append(
+            f"<tr class='{record['outcome']}'><td>{html.escape(record['nodeid'])}</td>"
+            f"<td>{record['outcome']}</td><td>{record['duration']:.3f}</td>"
+            f"<td><ul>{request_rows}</ul><details><summary>log</summary><pre>{details}</pre></details></td></tr>"
+        )
+
+    trend_rows = []
+    if len(run_ids) > 1:
+        nodeids = list(dict.fromkeys(record["nodeid"] for record in records))
+        by_run = {run_id: {r["nodeid"]: r for r in runs[run_id]} for run_id in run_ids}
+        for nodeid in nodeids:
+            cells = []
+            for run_id in run_ids:
+                record = by_run[run_id].get(nodeid)
+                if record:
+                    cells.append(f"<td class='{record['outcome']}'>{record['outcome']} {record['duration']:.3f}s</td>")
+                else:
+                    cells.append("<td></td>")
+            trend_rows.append(f"<tr><td>{html.escape(nodeid)}</td>{''.join(cells)}</tr>")
+
+    counts = {}
+    for record in latest:
+        counts[record["outcome"]] = counts.get(record["outcome"], 0) + 1
+    summary = ", ".join(f"{count} {outcome}" for outcome, count in sorted(counts.items()))
+
+    trend_table = ""
+    if trend_rows:
+        headers = "".join(f"<th>run {index + 1}</th>" for index in range(len(run_ids)))
+        trend_table = f"<h2>Trend</h2><table><tr><th>Test</th>{headers}</tr>{''.join(trend_rows)}</table>"
+
+    page = (
+        "<!DOCTYPE html><html><head><meta charset='utf-8'><title>Test Report</title><style>"
+        "table{border-collapse:collapse}td,th{border:1px solid #ccc;padding:4px;vertical-align:top}"
+        ".passed{color:green}.failed,.error{color:red}.skipped{color:orange}"
+        "</style></head><body>"
+        f"<h1>Test Report</h1><p>{len(latest)} tests: {summary}</p>"
+        "<table><tr><th>Test</th><th>Outcome</th><th>Duration (s)</th><th>Requests</th></tr>"
+        f"{''.join(rows)}</table>{trend_table}</body></html>"
+    )
+    with open(output_path, "w") as file:
+        file.write(page)
+
+
+def render_allure(records, output_dir):
+    """
+    Write Allure result files for every record, so `allure serve` can show the runs and their history.
+
+    Args:
+        records (list): The test records ordered by start time.
+        output_dir (str): The Allure results directory to write to.
+    """
+    os.makedirs(output_dir, exist_ok=True)
+    for record in records:
+        nodeid = record["nodeid"]
+        result = {
+            "uuid": str(uuid.uuid4()),
+            "historyId": hashlib.md5(nodeid.encode()).hexdigest(),
+            "name": nodeid.split("::")[-1],
+            "fullName": nodeid,
+            "status": ALLURE_STATUSES.get(record["outcome"], "unknown"),
+            "statusDetails": {
+                "message": record.get("message") or "",
+                "trace": "\n".join(record.get("log_excerpt", [])),
+            },
+            "start": int(record["start"] * 1000),
+            "stop": int(record["stop"] * 1000),
+            "labels": [{"name": "suite", "value": nodeid.split("::")[0]}],
+        }
+        with open(os.path.join(output_dir, f"{result['uuid']}-result.json"), "w") as file:
+            json.dump(result, file)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Render HTML and Allure reports from JSONL test results.")
+    parser.add_argument("results", nargs="*", default=[DEFAULT_RESULTS_PATH],
+                        help="JSONL result files to merge (default: %(default)s)")
+    parser.add_argument("--html", help="Write a self-contained HTML report to this path")
+    parser.add_argument("--allure", help="Write Allure results to this directory")
+    args = parser.parse_args()
+
+    records = load_results(args.results)
+    if args.html:
+        render_html(records, args.html)
+    if args.allure:
+        render_allure(records, args.allure)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+import atexit
+import logging
+import threading
+import uuid
+import requests
+
+# Configure logging
+logging.basicConfig(level=logging.INFO, format="%(asctime)s - %(levelname)s - %(message)s")
+logger = logging.getLogger(__name__)
+
+BASE_URL = "http://127.0.0.1:8000"
+MAX_WORKERS = 8
+# Appended to model names so this run never collides with leftovers or other users of a shared server
+RUN_ID = uuid.uuid4().hex[:8]
+
+# Resources created during this run, in creation order
+_models = {}
+_versions = {}
+_lock = threading.Lock()
+_leaked = []
+
+
+def run_scoped_name(name):
+    """
+    Make a model name unique to this run by appending the run ID.
+
+    Empty names are returned unchanged, so tests of empty input still send empty input.
+
+    Args:
+        name (str): The model name from the test data.
+
+    Returns:
+        str: The name to send to the server.
+    """
+    return f"{name} {RUN_ID}" if name else name
+
+
+def record_model(model_id):
+    """
+    Record a model created during this run so it is deleted at session end.
+
+    Args:
+        model_id (str): The ID of the created model.
+    """
+    with _lock:
+        _models[model_id] = True
+
+
+def record_model_version(model_id, version_id):
+    """
+    Record a model version created during this run so it is deleted at session end.
+
+    Args:
+        model_id (str): The ID of the parent model.
+        version_id (str): The ID of the created model version.
+    """
+    with _lock:
+        _versions[(model_id, version_id)] = True
+
+
+def forget_model(model_id):
+    """
+    Remove a model, and the versions recorded under it, from the ledger once a test has deleted it.
+
+    Args:
+        model_id (str): The ID of the deleted model.
+    """
+    with _lock:
+        _models.pop(model_id, None)
+        for key in [key for key in _versions if key[0] == model_id]:
+            del _versions[key]
+
+
+def forget_model_version(model_id, version_id):
+    """
+    Remove a model version from the ledger once a test has deleted it.
+
+    Args:
+        model_id (str): The ID of the parent model.
+        version_id (str): The ID of the deleted model version.
+    """
+    with _lock:
+        _versions.pop((model_id, version_id), None)
+
+
+def _delete(url):
+    """
+    Delete a single resource, treating an already missing resource as deleted.
+
+    Args:
+        url (str): The URL of the resource to delete.
+
+    Returns:
+        str: An error description if the resource could not be deleted, otherwise None.
+    """
+    try:
+        response = requests.delete(url, timeout=30)
+    except requests.exceptions.RequestException as e:
+        return str(e)
+    if response.status_code in (200, 204, 404):
+        return None
+    return f"status code {response.status_code}"
+
+
+def _delete_concurrently(urls):
+    """
+    Delete resources on up to MAX_WORKERS threads.
+
+    Plain threads are used rather than a ThreadPoolExecutor, which refuses new work once the
+    interpreter starts shutting down and so cannot run from the atexit handler. If no thread can
+    be started at all, the resources are deleted sequentially.
+
+    Args:
+        urls (list): The URLs of the resources to delete.
+
+    Returns:
+        dict: URL mapped to the error description, for every resource that could not be deleted.
+    """
+    remaining = list(urls)
+    errors = {}
+    work_lock = threading.Lock()
+
+    def worker():
+        while True:
+            with work_lock:
+                if not remaining:
+                    return
+                url = remaining.pop()
+            error = _delete(url)
+            if error:
+                with work_lock:
+                    errors[url] = error
+
+    threads = []
+    for _ in range(min(MAX_WORKERS, len(remaining))):
+        thread = threading.Thread(target=worker)
+        try:
+            thread.start()
+        except RuntimeError:
+            break
+        threads.append(thread)
+    if not threads:
+        worker()
+    for thread in threads:
+        thread.join()
+    return errors
+
+
+def release_all():
+    """
+    Concurrently delete every resource recorded in the ledger, versions before models.
+
+    Resources are only removed from the ledger once their deletion succeeded, so a later call
+    retries whatever is left.
+
+    Returns:
+        list: The resources that could not be deleted, each as a dict with the URL and error.
+    """
+    with _lock:
+        version_urls = {f"{BASE_URL}/models/{model_id}/versions/{version_id}": (model_id, version_id)
+                        for model_id, version_id in _versions}
+        model_urls = {f"{BASE_URL}/models/{model_id}": model_id for model_id in _models}
+    if not version_urls and not model_urls:
+        return []
+
+    logger.info(f"Deleting {len(version_urls)} model versions and {len(model_urls)} models created during this run.")
+    leaked = []
+    for urls, ledger in ((version_urls, _versions), (model_urls, _models)):
+        errors = _delete_concurrently(list(urls))
+        with _lock:
+            for url, key in urls.items():
+                if url in errors:
+                    leaked.append({"url": url, "error": errors[url]})
+                else:
+                    ledger.pop(key, None)
+
+    for resource in leaked:
+        logger.error(f"Leaked resource {resource['url']}: {resource['error']}")
+    _leaked[:] = leaked
+    return leaked
+
+
+# Still clean up when the run ends without reaching pytest_sessionfinish
+atexit.register(release_all)
+
+
+def pytest_sessionfinish(session):
+    release_all()
+
+
+def pytest_terminal_summary(terminalreporter):
+    if not _leaked:
+        return
+    terminalreporter.section("leaked resources")
+    for resource in _leaked:
+        terminalreporter.line(f"{resource['url']}: {resource['error']}")
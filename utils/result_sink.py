@@ -0,0 +1,121 @@
+import json
+import os
+import time
+import uuid
+
+DEFAULT_RESULTS_PATH = os.path.join("test-results", "results.jsonl")
+LOG_EXCERPT_LINES = 20
+LONGREPR_EXCERPT_CHARS = 2000
+
+# Timings of the HTTP requests made by the test that is currently running
+_request_timings = []
+# Only collect timings while a sink is registered, so the list cannot grow unbounded
+_collecting = False
+
+
+def record_request_timing(response):
+    """
+    Record the timing of an HTTP request against the currently running test.
+
+    Args:
+        response (Response): The response object returned by requests.
+    """
+    if not _collecting:
+        return
+    _request_timings.append({
+        "method": response.request.method,
+        "url": response.request.url,
+        "status_code": response.status_code,
+        "elapsed": response.elapsed.total_seconds(),
+    })
+
+
+def pytest_addoption(parser):
+    group = parser.getgroup("result-sink")
+    group.addoption(
+        "--results-jsonl",
+        default=DEFAULT_RESULTS_PATH,
+        help=f"Write one JSON record per finished test to this file, replacing any earlier run "
+             f"(default: {DEFAULT_RESULTS_PATH}). Pass an empty value to disable.",
+    )
+
+
+def pytest_configure(config):
+    global _collecting
+    results_path = config.getoption("--results-jsonl")
+    if results_path and not hasattr(config, "workerinput"):
+        config.pluginmanager.register(ResultSink(results_path), "result-sink")
+        _collecting = True
+
+
+def pytest_unconfigure(config):
+    global _collecting
+    _collecting = False
+    _request_timings.clear()
+
+
+class ResultSink:
+    """
+    Streams one JSON record per test to a JSONL file as soon as the test finishes.
+
+    The file is replaced on every run. Every record carries the run ID, so the files of several runs
+    can be passed together to utils/render_results.py and rendered as a trend view.
+    """
+
+    def __init__(self, results_path):
+        self.results_path = results_path
+        self.run_id = uuid.uuid4().hex
+        self.file = None
+        self.current = None
+
+    def pytest_sessionstart(self, session):
+        directory = os.path.dirname(self.results_path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.file = open(self.results_path, "w")
+
+    def pytest_sessionfinish(self, session):
+        if self.file:
+            self.file.close()
+            self.file = None
+
+    def pytest_runtest_logstart(self, nodeid, location):
+        _request_timings.clear()
+        self.current = {
+            "run_id": self.run_id,
+            "nodeid": nodeid,
+            "outcome": "passed",
+            "start": time.time(),
+            "duration": 0.0,
+            "message": None,
+            "log_excerpt": [],
+        }
+
+    def pytest_runtest_logreport(self, report):
+        if self.current is None:
+            return
+        self.current["duration"] += report.duration
+        if report.failed:
+            self.current["outcome"] = "failed" if report.when == "call" else "error"
+            self.current["message"] = report.longreprtext[-LONGREPR_EXCERPT_CHARS:]
+        elif report.skipped and self.current["outcome"] == "passed":
+            self.current["outcome"] = "skipped"
+            # Skips carry a (path, line, reason) tuple rather than a traceback
+            if isinstance(report.longrepr, tuple):
+                self.current["message"] = report.longrepr[2]
+            else:
+                self.current["message"] = report.longreprtext[-LONGREPR_EXCERPT_CHARS:]
+        # Captured log sections accumulate across phases, so the latest report holds them all
+        if report.caplog:
+            self.current["log_excerpt"] = report.caplog.splitlines()
+
+    def pytest_runtest_logfinish(self, nodeid, location):
+        if self.current is None or self.file is None:
+            return
+        record = self.current
+        record["stop"] = time.time()
+        record["log_excerpt"] = record["log_excerpt"][-LOG_EXCERPT_LINES:]
+        record["requests"] = list(_request_timings)
+        self.file.write(json.dumps(record) + "\n")
+        self.file.flush()
+        self.current = None